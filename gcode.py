@@ -5,99 +5,287 @@ Tool for validating and visualizing G-code with image output
 """
 
 import re
+import array
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle
 import numpy as np
 import sys
 import os
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator leaving the function as plain Python"""
+        return lambda func: func
+
+# Precompiled patterns used on every line of the program. G-code is ASCII
+# and lines are upper-cased before matching, so patterns use re.ASCII and
+# only match upper-case letters.
+_COORD_RE = {axis: re.compile(f'{axis}([+-]?\\d*\\.?\\d+)', re.ASCII) for axis in 'XYZ'}
+_XYZ_RE = re.compile(r'([XYZ])([+-]?\d*\.?\d+)', re.ASCII)
+# Axis words and the unsigned feed rate word, matched in a single scan
+_WORD_RE = re.compile(r'([XYZ])([+-]?\d*\.?\d+)|F(\d*\.?\d+)', re.ASCII)
+_O_RE = re.compile(r'^O(\d+)', re.ASCII)
+_P_RE = re.compile(r'P(\d+)', re.ASCII)
+_FEED_RE = re.compile(r'F(\d*\.?\d+)', re.ASCII)
+
+# Address letters that may start a line without a G/M command
+_ARG_LETTERS = frozenset('XYZIJKRFSTN')
+# Program/subprogram number letters, valid at line start when followed by digits
+_OP_LETTERS = frozenset('OP')
+
+
+@njit(cache=True)
+def _scan_number(buf, i, n, signed):
+    """Parse a decimal number with optional sign at buf[i]
+
+    Returns (value, end) where end is the index after the number,
+    or -1 if no number starts at buf[i].
+    """
+    negative = False
+    if signed and i < n and (buf[i] == 43 or buf[i] == 45):  # '+' / '-'
+        negative = buf[i] == 45
+        i += 1
+
+    mantissa = 0.0
+    scale = 1.0
+    digits = 0
+    while i < n and 48 <= buf[i] <= 57:
+        mantissa = mantissa * 10.0 + (buf[i] - 48)
+        digits += 1
+        i += 1
+    if i + 1 < n and buf[i] == 46 and 48 <= buf[i + 1] <= 57:  # '.'
+        i += 1
+        while i < n and 48 <= buf[i] <= 57:
+            mantissa = mantissa * 10.0 + (buf[i] - 48)
+            scale *= 10.0
+            digits += 1
+            i += 1
+
+    if digits == 0:
+        return 0.0, -1
+    value = mantissa / scale
+    return (-value if negative else value), i
+
+
+@njit(cache=True)
+def scan_line(buf):
+    """Scan an ASCII G-code line without regex
+
+    Returns (cmd_letter, cmd_num, x, y, z, f, has_x, has_y, has_z, has_f).
+    cmd_letter is the upper-cased code of the leading letter (0 if none) and
+    cmd_num the integer following it (-1 if none). As in parse_coordinate, the
+    first word for each of X/Y/Z wins and the first unsigned F word is the
+    feed rate.
+    """
+    n = len(buf)
+    cmd_letter = 0
+    cmd_num = -1
+    x = y = z = f = 0.0
+    has_x = has_y = has_z = has_f = False
+
+    if n > 0:
+        c = buf[0]
+        if 97 <= c <= 122:
+            c &= 0xDF
+        if 65 <= c <= 90:
+            cmd_letter = c
+            j = 1
+            while j < n and 48 <= buf[j] <= 57:
+                cmd_num = (0 if cmd_num < 0 else cmd_num * 10) + (buf[j] - 48)
+                j += 1
+
+    i = 0
+    while i < n:
+        c = buf[i]
+        if 97 <= c <= 122:
+            c &= 0xDF
+        if ((c == 88 and not has_x) or (c == 89 and not has_y)
+                or (c == 90 and not has_z) or (c == 70 and not has_f)):  # X Y Z F
+            value, end = _scan_number(buf, i + 1, n, c != 70)
+            if end >= 0:
+                if c == 88:
+                    x, has_x = value, True
+                elif c == 89:
+                    y, has_y = value, True
+                elif c == 90:
+                    z, has_z = value, True
+                else:
+                    f, has_f = value, True
+                i = end
+                continue
+        i += 1
+
+    return cmd_letter, cmd_num, x, y, z, f, has_x, has_y, has_z, has_f
+
 class GCodeChecker:
     def __init__(self):
-        self.x_positions = []
-        self.y_positions = []
-        self.z_positions = []
+        # One contiguous buffer per axis; float32 is ample for plotting and range checks
+        self._x = array.array('f')
+        self._y = array.array('f')
+        self._z = array.array('f')
+        self._ranges = None  # (position count, travel ranges) cache
+        # Directory listings and analyzed subprogram checkers (keyed by
+        # absolute path and mtime) for the current run, shared with nested
+        # subprogram checkers
+        self._dir_cache = {}
+        self._sub_cache = {}
         self.current_x = 0.0
         self.current_y = 0.0
         self.current_z = 0.0
         self.errors = []
         self.warnings = []
-        self.commands = []
+        self.command_count = 0
         self.main_programs = []
         self.subprograms = {}
         self.program_calls = []
-        self.supported_extensions = ['.nc', '.txt', '.gcode', '.cnc']
+        # Sets mirroring the lists above for O(1) membership tests
+        self._main_programs_set = set()
+        self._program_calls_set = set()
+        self.supported_extensions = frozenset(['.nc', '.txt', '.gcode', '.cnc'])
+
+    def _positions(self):
+        """Return zero-copy NumPy views (x, y, z) of the stored positions
+
+        The views pin the underlying buffers, so they must not outlive the
+        current call while more positions may still be appended.
+        """
+        return tuple(np.frombuffer(buf, dtype=np.float32) for buf in (self._x, self._y, self._z))
+
+    def travel_ranges(self):
+        """Return ((min, max) for X, (min, max) for Y, (min, max) for Z)
+
+        Computed once per number of stored positions and shared by the
+        visualization and the console report.
+        """
+        if self._ranges is None or self._ranges[0] != len(self._x):
+            ranges = tuple((float(axis.min()), float(axis.max())) for axis in self._positions())
+            self._ranges = (len(self._x), ranges)
+        return self._ranges[1]
+
+    @property
+    def x_positions(self):
+        """Copy of all visited X positions"""
+        return np.array(self._x, dtype=np.float32)
+
+    @property
+    def y_positions(self):
+        """Copy of all visited Y positions"""
+        return np.array(self._y, dtype=np.float32)
+
+    @property
+    def z_positions(self):
+        """Copy of all visited Z positions"""
+        return np.array(self._z, dtype=np.float32)
 
     def parse_coordinate(self, line, axis):
         """Extract coordinate value for given axis (X, Y, Z)"""
-        pattern = f'{axis}([+-]?\\d*\\.?\\d+)'
-        match = re.search(pattern, line.upper())
+        # Cheap substring tests before running the regex; only upper-case
+        # the line when it contains a lower-case axis letter
+        if axis.lower() in line:
+            line = line.upper()
+        elif axis not in line:
+            return None
+        match = _COORD_RE[axis].search(line)
         if match:
             return float(match.group(1))
         return None
 
     def check_syntax(self, line):
         """Check basic G-code syntax"""
-        line = line.strip().upper()
+        return self._check_syntax_upper(line.strip().upper())
+
+    def _check_syntax_upper(self, line):
+        """check_syntax for a line that is already stripped and upper-cased"""
         if not line or line.startswith(';') or line.startswith('('):
             return True
 
         # Check for program structure commands
-        self.check_program_structure(line)
+        self._check_program_structure_upper(line)
 
         # Check for valid G-code command
-        if not re.match(r'^[GM]\d+', line):
-            if not re.match(r'^[XYZIJKR]', line) and not line.startswith('F') and not line.startswith('S') and not line.startswith('T') and not line.startswith('N') and not re.match(r'^[OP]\d+', line):
-                self.errors.append(f"Invalid command format: {line}")
-                return False
-        return True
+        first = line[:1]
+        if first in ('G', 'M') and line[1:2].isdigit():
+            return True
+        if first in _ARG_LETTERS:
+            return True
+        if first in _OP_LETTERS and line[1:2].isdigit():
+            return True
+        self.errors.append(f"Invalid command format: {line}")
+        return False
 
     def check_coordinates(self, line):
         """Validate coordinate values"""
-        x = self.parse_coordinate(line, 'X')
-        y = self.parse_coordinate(line, 'Y')
-        z = self.parse_coordinate(line, 'Z')
-
-        # Update current position
-        if x is not None:
-            self.current_x = x
-        if y is not None:
-            self.current_y = y
-        if z is not None:
-            self.current_z = z
-
-        # Store positions for visualization
-        self.x_positions.append(self.current_x)
-        self.y_positions.append(self.current_y)
-        self.z_positions.append(self.current_z)
-
-        # Check for extreme values
+        # Update current position from all axis words in a single scan;
+        # the first word for each axis wins
+        seen = set()
+        for match in _XYZ_RE.finditer(line.upper()):
+            axis = match.group(1)
+            if axis in seen:
+                continue
+            seen.add(axis)
+            value = float(match.group(2))
+            if axis == 'X':
+                self.current_x = value
+            elif axis == 'Y':
+                self.current_y = value
+            else:
+                self.current_z = value
+
+        self._store_position()
+
+    def _store_position(self):
+        """Record the current position for visualization and range checks"""
+        self._x.append(self.current_x)
+        self._y.append(self.current_y)
+        self._z.append(self.current_z)
+
+    def check_travel_range(self):
+        """Check all stored positions against the typical travel range"""
+        if not self._x:
+            return
+
         max_travel = 1000  # mm
-        if abs(self.current_x) > max_travel:
-            self.warnings.append(f"X coordinate {self.current_x} exceeds typical travel range")
-        if abs(self.current_y) > max_travel:
-            self.warnings.append(f"Y coordinate {self.current_y} exceeds typical travel range")
-        if abs(self.current_z) > max_travel:
-            self.warnings.append(f"Z coordinate {self.current_z} exceeds typical travel range")
+        # Values are float32; !s formats them with their shortest repr
+        for axis, positions in zip('XYZ', self._positions()):
+            values = positions[np.abs(positions) > max_travel]
+            if len(values) == 1:
+                self.warnings.append(f"{axis} coordinate {values[0]!s} exceeds typical travel range")
+            elif len(values) > 1:
+                largest = values[np.argmax(np.abs(values))]
+                self.warnings.append(f"{len(values)} {axis} coordinates exceed typical travel range (largest: {largest!s})")
 
     def check_program_structure(self, line):
         """Check for main programs and subprograms"""
-        line_upper = line.upper().strip()
+        self._check_program_structure_upper(line.upper().strip())
+
+    def _check_program_structure_upper(self, line_upper):
+        """check_program_structure for a line that is already stripped and upper-cased"""
 
         # Check for program start (O number or %)
-        if re.match(r'^O\d+', line_upper):
-            prog_num = re.search(r'O(\d+)', line_upper).group(1)
-            if prog_num not in self.main_programs:
+        prog_match = None
+        if line_upper.startswith('O') and line_upper[1:2].isdigit():
+            prog_match = _O_RE.match(line_upper)
+        if prog_match:
+            prog_num = prog_match.group(1)
+            if prog_num not in self._main_programs_set:
+                self._main_programs_set.add(prog_num)
                 self.main_programs.append(prog_num)
 
         # Check for subprogram calls (M98 P)
         if 'M98' in line_upper and 'P' in line_upper:
-            sub_match = re.search(r'P(\d+)', line_upper)
+            sub_match = _P_RE.search(line_upper)
             if sub_match:
                 sub_num = sub_match.group(1)
+                self._program_calls_set.add(sub_num)
                 self.program_calls.append(sub_num)
 
         # Check for subprogram definition start
-        if re.match(r'^%', line_upper):
+        if line_upper.startswith('%'):
             return
 
         # Check for subprogram end (M99)
@@ -105,7 +293,7 @@ class GCodeChecker:
             return
 
         # Check for program end (M30, M02)
-        if re.match(r'^M(30|02)', line_upper):
+        if line_upper.startswith(('M30', 'M02')):
             return
 
     def auto_detect_and_analyze_subprograms(self, main_filename):
@@ -113,6 +301,20 @@ class GCodeChecker:
         main_dir = os.path.dirname(main_filename)
         if not main_dir:
             main_dir = "."
+        # Resolved once per directory rather than once per subprogram file
+        abs_dir = os.path.abspath(main_dir)
+
+        # One listdir per directory instead of a stat per candidate name
+        listing = self._dir_cache.get(abs_dir)
+        if listing is None:
+            try:
+                entries = set(os.listdir(abs_dir))
+            except OSError:
+                entries = set()
+            # Case variants of listed names, for case-insensitive filesystems
+            listing = (entries, {entry.lower(): entry for entry in entries})
+            self._dir_cache[abs_dir] = listing
+        entries, lowered = listing
 
         detected_subprograms = []
 
@@ -128,33 +330,52 @@ class GCodeChecker:
             ]
 
             for name in possible_names:
-                subprogram_path = os.path.join(main_dir, name)
-                if os.path.exists(subprogram_path):
+                entry = name if name in entries else None
+                if entry is None and name.lower() in lowered:
+                    # Only a case variant is listed; let the filesystem decide
+                    # whether the probed name refers to it, as exists() did
+                    if os.path.exists(os.path.join(main_dir, name)):
+                        entry = lowered[name.lower()]
+                if entry is not None:
+                    subprogram_path = os.path.join(main_dir, entry)
+                    try:
+                        mtime = os.path.getmtime(subprogram_path)
+                    except OSError:
+                        # Listed earlier but gone now; treat as absent
+                        continue
                     print(f"Found subprogram: {subprogram_path}")
 
-                    # Analyze the subprogram
-                    sub_checker = GCodeChecker()
-                    if sub_checker.analyze_file(subprogram_path):
+                    # Analyze the subprogram, reusing an earlier result for the same file
+                    key = (os.path.join(abs_dir, entry), mtime)
+                    sub_checker = self._sub_cache.get(key)
+                    if sub_checker is None:
+                        sub_checker = GCodeChecker()
+                        if sub_checker.analyze_file(subprogram_path, _dir_cache=self._dir_cache,
+                                                    _sub_cache=self._sub_cache):
+                            self._sub_cache[key] = sub_checker
+                        else:
+                            sub_checker = None
+
+                    if sub_checker is not None:
                         detected_subprograms.append({
-                            'file': name,
+                            'file': entry,
                             'path': subprogram_path,
                             'errors': len(sub_checker.errors),
                             'warnings': len(sub_checker.warnings),
-                            'commands': len(sub_checker.commands)
+                            'commands': sub_checker.command_count
                         })
 
                         # Add subprogram errors/warnings to main report
-                        for error in sub_checker.errors:
-                            self.errors.append(f"Subprogram {name}: {error}")
-                        for warning in sub_checker.warnings:
-                            self.warnings.append(f"Subprogram {name}: {warning}")
+                        self.errors.extend(f"Subprogram {entry}: {error}" for error in sub_checker.errors)
+                        self.warnings.extend(f"Subprogram {entry}: {warning}" for warning in sub_checker.warnings)
 
                         # Mark as found
-                        if call in self.program_calls:
+                        if call in self._program_calls_set:
+                            self._main_programs_set.add(call)
                             self.main_programs.append(call)
 
-                        print(f"✅ Auto-detected and analyzed subprogram: {name}")
-                        print(f"   Commands: {len(sub_checker.commands)}, Errors: {len(sub_checker.errors)}, Warnings: {len(sub_checker.warnings)}")
+                        print(f"✅ Auto-detected and analyzed subprogram: {entry}")
+                        print(f"   Commands: {sub_checker.command_count}, Errors: {len(sub_checker.errors)}, Warnings: {len(sub_checker.warnings)}")
                     break
 
         return detected_subprograms
@@ -163,12 +384,12 @@ class GCodeChecker:
         """Validate program structure and subprogram calls"""
         # Check if all called subprograms exist
         for call in self.program_calls:
-            if call not in self.main_programs:
+            if call not in self._main_programs_set:
                 self.warnings.append(f"Subprogram P{call} called but not defined")
 
         # Check for unused subprograms
         for prog in self.main_programs[1:]:  # Skip main program
-            if prog not in self.program_calls:
+            if prog not in self._program_calls_set:
                 self.warnings.append(f"Subprogram O{prog} defined but never called")
 
     def check_file_format(self, filename):
@@ -180,40 +401,91 @@ class GCodeChecker:
 
     def check_feed_rate(self, line):
         """Check feed rate commands"""
-        if 'F' in line.upper():
-            feed_match = re.search(r'F(\d*\.?\d+)', line.upper())
+        line = line.upper()
+        if 'F' in line:
+            feed_match = _FEED_RE.search(line)
             if feed_match:
-                feed_rate = float(feed_match.group(1))
-                if feed_rate > 10000:  # mm/min
-                    self.warnings.append(f"High feed rate: {feed_rate} mm/min")
-                elif feed_rate <= 0:
-                    self.errors.append(f"Invalid feed rate: {feed_rate}")
+                self._validate_feed_rate(float(feed_match.group(1)))
+
+    def _validate_feed_rate(self, feed_rate):
+        """Check a parsed feed rate value"""
+        if feed_rate > 10000:  # mm/min
+            self.warnings.append(f"High feed rate: {feed_rate} mm/min")
+        elif feed_rate <= 0:
+            self.errors.append(f"Invalid feed rate: {feed_rate}")
+
+    def _parse_line(self, line):
+        """Run all per-line checks on an upper-cased, stripped line
 
-    def analyze_file(self, filename):
+        Coordinates and feed rate are extracted in a single scan (compiled
+        when numba is available) instead of one scan per check.
+        """
+        self._check_syntax_upper(line)
+
+        has_axis = 'X' in line or 'Y' in line or 'Z' in line
+        if not has_axis and 'F' not in line:
+            return
+
+        feed_rate = None
+        if NUMBA_AVAILABLE:
+            (_, _, x, y, z, f,
+             has_x, has_y, has_z, has_f) = scan_line(line.encode('ascii', 'replace'))
+            if has_x:
+                self.current_x = x
+            if has_y:
+                self.current_y = y
+            if has_z:
+                self.current_z = z
+            if has_f:
+                feed_rate = f
+        else:
+            # The first word for each axis and for F wins
+            seen = set()
+            for match in _WORD_RE.finditer(line):
+                axis = match.group(1)
+                if axis is None:
+                    if feed_rate is None:
+                        feed_rate = float(match.group(3))
+                    continue
+                if axis in seen:
+                    continue
+                seen.add(axis)
+                if axis == 'X':
+                    self.current_x = float(match.group(2))
+                elif axis == 'Y':
+                    self.current_y = float(match.group(2))
+                else:
+                    self.current_z = float(match.group(2))
+
+        if has_axis:
+            self._store_position()
+        if feed_rate is not None:
+            self._validate_feed_rate(feed_rate)
+
+    def analyze_file(self, filename, _dir_cache=None, _sub_cache=None):
         """Analyze G-code file"""
+        # Caches live for one top-level run so new or changed files are seen
+        self._dir_cache = {} if _dir_cache is None else _dir_cache
+        self._sub_cache = {} if _sub_cache is None else _sub_cache
+
         # Check file format
         self.check_file_format(filename)
 
         try:
-            with open(filename, 'r', encoding='utf-8', errors='ignore') as file:
-                lines = file.readlines()
+            # Stream the file line by line instead of loading it into memory
+            with open(filename, 'r', encoding='utf-8', errors='ignore', buffering=1 << 20) as file:
+                for line in file:
+                    line = line.strip()
+                    if not line:
+                        continue
 
-            for line_num, line in enumerate(lines, 1):
-                line = line.strip()
-                if not line:
-                    continue
-
-                self.commands.append((line_num, line))
-
-                # Check syntax
-                self.check_syntax(line)
+                    self.command_count += 1
 
-                # Check coordinates and movement
-                if any(axis in line.upper() for axis in ['X', 'Y', 'Z']):
-                    self.check_coordinates(line)
+                    # Syntax, coordinates and feed rate in one pass
+                    self._parse_line(line.upper())
 
-                # Check feed rate
-                self.check_feed_rate(line)
+            # Range-check all positions at once after reading all lines
+            self.check_travel_range()
 
             # Validate program structure after reading all lines
             self.auto_detect_and_analyze_subprograms(filename)
@@ -230,18 +502,22 @@ class GCodeChecker:
 
     def create_visualization(self, output_filename):
         """Create visualization of G-code path"""
-        if not self.x_positions or not self.y_positions:
+        if not self._x:
             print("No position data to visualize")
             return
 
+        # Build the axis arrays once and share them between all plots
+        x, y, z = self._positions()
+        (x_min, x_max), (y_min, y_max), (z_min, z_max) = self.travel_ranges()
+
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
         fig.suptitle('G-Code Analysis Report', fontsize=16, fontweight='bold')
 
         # XY Plot (Top view)
-        ax1.plot(self.x_positions, self.y_positions, 'b-', linewidth=1, alpha=0.7)
-        ax1.scatter(self.x_positions[0], self.y_positions[0], color='green', s=100, marker='o', label='Start')
-        if len(self.x_positions) > 1:
-            ax1.scatter(self.x_positions[-1], self.y_positions[-1], color='red', s=100, marker='s', label='End')
+        ax1.plot(x, y, 'b-', linewidth=1, alpha=0.7)
+        ax1.scatter(x[0], y[0], color='green', s=100, marker='o', label='Start')
+        if len(x) > 1:
+            ax1.scatter(x[-1], y[-1], color='red', s=100, marker='s', label='End')
         ax1.set_xlabel('X (mm)')
         ax1.set_ylabel('Y (mm)')
         ax1.set_title('XY Path (Top View)')
@@ -250,10 +526,10 @@ class GCodeChecker:
         ax1.axis('equal')
 
         # XZ Plot (Front view)
-        ax2.plot(self.x_positions, self.z_positions, 'r-', linewidth=1, alpha=0.7)
-        ax2.scatter(self.x_positions[0], self.z_positions[0], color='green', s=100, marker='o', label='Start')
-        if len(self.x_positions) > 1:
-            ax2.scatter(self.x_positions[-1], self.z_positions[-1], color='red', s=100, marker='s', label='End')
+        ax2.plot(x, z, 'r-', linewidth=1, alpha=0.7)
+        ax2.scatter(x[0], z[0], color='green', s=100, marker='o', label='Start')
+        if len(x) > 1:
+            ax2.scatter(x[-1], z[-1], color='red', s=100, marker='s', label='End')
         ax2.set_xlabel('X (mm)')
         ax2.set_ylabel('Z (mm)')
         ax2.set_title('XZ Path (Front View)')
@@ -261,10 +537,10 @@ class GCodeChecker:
         ax2.legend()
 
         # YZ Plot (Side view)
-        ax3.plot(self.y_positions, self.z_positions, 'g-', linewidth=1, alpha=0.7)
-        ax3.scatter(self.y_positions[0], self.z_positions[0], color='green', s=100, marker='o', label='Start')
-        if len(self.y_positions) > 1:
-            ax3.scatter(self.y_positions[-1], self.z_positions[-1], color='red', s=100, marker='s', label='End')
+        ax3.plot(y, z, 'g-', linewidth=1, alpha=0.7)
+        ax3.scatter(y[0], z[0], color='green', s=100, marker='o', label='Start')
+        if len(y) > 1:
+            ax3.scatter(y[-1], z[-1], color='red', s=100, marker='s', label='End')
         ax3.set_xlabel('Y (mm)')
         ax3.set_ylabel('Z (mm)')
         ax3.set_title('YZ Path (Side View)')
@@ -275,14 +551,14 @@ class GCodeChecker:
         ax4.axis('off')
         stats_text = f"""G-Code Analysis Summary:
 
-Total Commands: {len(self.commands)}
+Total Commands: {self.command_count}
 Main Programs: {len(self.main_programs)}
 Subprogram Calls: {len(self.program_calls)}
 
 Travel Range:
-  X: {min(self.x_positions):.2f} to {max(self.x_positions):.2f} mm
-  Y: {min(self.y_positions):.2f} to {max(self.y_positions):.2f} mm
-  Z: {min(self.z_positions):.2f} to {max(self.z_positions):.2f} mm
+  X: {x_min:.2f} to {x_max:.2f} mm
+  Y: {y_min:.2f} to {y_max:.2f} mm
+  Z: {z_min:.2f} to {z_max:.2f} mm
 
 Errors: {len(self.errors)}
 Warnings: {len(self.warnings)}
@@ -295,17 +571,21 @@ Status: {'✓ PASS' if len(self.errors) == 0 else '✗ FAIL'}
                 bbox=dict(boxstyle="round,pad=0.5", facecolor="lightgray", alpha=0.8))
 
         if self.errors:
-            error_text = "ERRORS:\n" + "\n".join([f"• {error}" for error in self.errors[:5]])
+            parts = ["ERRORS:"]
+            parts.extend(f"• {error}" for error in self.errors[:5])
             if len(self.errors) > 5:
-                error_text += f"\n... and {len(self.errors) - 5} more errors"
+                parts.append(f"... and {len(self.errors) - 5} more errors")
+            error_text = "\n".join(parts)
             ax4.text(0.05, 0.45, error_text, transform=ax4.transAxes, fontsize=9,
                     verticalalignment='top', fontfamily='monospace', color='red',
                     bbox=dict(boxstyle="round,pad=0.3", facecolor="mistyrose", alpha=0.8))
 
         if self.warnings:
-            warning_text = "WARNINGS:\n" + "\n".join([f"• {warning}" for warning in self.warnings[:3]])
+            parts = ["WARNINGS:"]
+            parts.extend(f"• {warning}" for warning in self.warnings[:3])
             if len(self.warnings) > 3:
-                warning_text += f"\n... and {len(self.warnings) - 3} more warnings"
+                parts.append(f"... and {len(self.warnings) - 3} more warnings")
+            warning_text = "\n".join(parts)
             ax4.text(0.05, 0.15, warning_text, transform=ax4.transAxes, fontsize=9,
                     verticalalignment='top', fontfamily='monospace', color='orange',
                     bbox=dict(boxstyle="round,pad=0.3", facecolor="lightyellow", alpha=0.8))
@@ -317,41 +597,41 @@ Status: {'✓ PASS' if len(self.errors) == 0 else '✗ FAIL'}
 
     def print_report(self):
         """Print analysis report to console"""
-        print("\n" + "="*60)
-        print("G-CODE ANALYSIS REPORT")
-        print("="*60)
+        # Collect the report and write it in one go
+        lines = ["", "="*60, "G-CODE ANALYSIS REPORT", "="*60]
 
-        print(f"Total Commands Processed: {len(self.commands)}")
+        lines.append(f"Total Commands Processed: {self.command_count}")
 
         if self.main_programs:
-            print(f"\nProgram Structure:")
-            print(f"  Main Programs: {', '.join(['O' + p for p in self.main_programs])}")
+            lines.append("\nProgram Structure:")
+            lines.append(f"  Main Programs: {', '.join(['O' + p for p in self.main_programs])}")
             if self.program_calls:
-                print(f"  Subprogram Calls: {', '.join(['P' + p for p in self.program_calls])}")
+                lines.append(f"  Subprogram Calls: {', '.join(['P' + p for p in self.program_calls])}")
 
-        if self.x_positions:
-            print(f"\nTravel Ranges:")
-            print(f"  X: {min(self.x_positions):.2f} to {max(self.x_positions):.2f} mm")
-            print(f"  Y: {min(self.y_positions):.2f} to {max(self.y_positions):.2f} mm")
-            print(f"  Z: {min(self.z_positions):.2f} to {max(self.z_positions):.2f} mm")
+        if self._x:
+            (x_min, x_max), (y_min, y_max), (z_min, z_max) = self.travel_ranges()
+            lines.append("\nTravel Ranges:")
+            lines.append(f"  X: {x_min:.2f} to {x_max:.2f} mm")
+            lines.append(f"  Y: {y_min:.2f} to {y_max:.2f} mm")
+            lines.append(f"  Z: {z_min:.2f} to {z_max:.2f} mm")
 
-        print(f"\nValidation Results:")
-        print(f"  Errors: {len(self.errors)}")
-        print(f"  Warnings: {len(self.warnings)}")
+        lines.append("\nValidation Results:")
+        lines.append(f"  Errors: {len(self.errors)}")
+        lines.append(f"  Warnings: {len(self.warnings)}")
 
         if self.errors:
-            print(f"\nERRORS:")
-            for error in self.errors:
-                print(f"  ✗ {error}")
+            lines.append("\nERRORS:")
+            lines.extend(f"  ✗ {error}" for error in self.errors)
 
         if self.warnings:
-            print(f"\nWARNINGS:")
-            for warning in self.warnings:
-                print(f"  ⚠ {warning}")
+            lines.append("\nWARNINGS:")
+            lines.extend(f"  ⚠ {warning}" for warning in self.warnings)
 
         status = "PASS" if len(self.errors) == 0 else "FAIL"
-        print(f"\nFINAL STATUS: {status}")
-        print("="*60)
+        lines.append(f"\nFINAL STATUS: {status}")
+        lines.append("="*60)
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     if len(sys.argv) != 2: